@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:40 2026
+
+Convex arenas for the Game of Cat and Mouse.
+
+An arena is a convex closed curve around the origin. The cat runs along the
+curve and its position is given by the arc length s, measured counter
+clockwise from the point where the curve crosses the positive X axis. For the
+unit circle, the arc length is the same as the polar angle used throughout
+catmouse.py, so the circle results are unchanged.
+
+General arenas are represented by a polygon. The cumulative arc length of
+each vertex and its polar angle are tabulated once when the arena is created.
+Every lookup is then a binary search in one of the two tables:
+- point(s): arc length to cartesian coordinates, via the arc length table.
+- radius(theta): distance from the center to the rim along a ray, via the
+  angle table.
+- project(x, y): arc length of the rim point on the ray from the center
+  through (x, y), via the angle table. This is the rim point the cat aims at.
+- escaped(x, y): whether (x, y) is on or outside the rim, via radius().
+
+project() is a radial projection, not the rim point closest to (x, y). Both
+are the same on the circle only. The closest point is not a binary search:
+seen from a point inside the arena, the distance to the rim can have several
+local minima along the rim, two for the center of an ellipse. The radial
+projection is what the cat already aimed at on the circle.
+"""
+
+import math
+from bisect import bisect_right
+
+TWO_PI = 2 * math.pi
+
+'''
+Cross product of two 2D vectors.
+'''
+def cross(ax, ay, bx, by):
+    return ax * by - ay * bx
+
+class Arena:
+    '''
+    vertices: List of (x, y) coordinates of a convex polygon listed counter
+    clockwise. The origin must be strictly inside the polygon.
+    '''
+    def __init__(self, vertices):
+        if len(vertices) < 3:
+            raise ValueError('An arena needs at least 3 vertices')
+
+        edges = [(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1])]
+        for (ex1, ey1), (ex2, ey2) in zip(edges, edges[1:] + edges[:1]):
+            if cross(ex1, ey1, ex2, ey2) < 0:
+                raise ValueError('Arena vertices must be convex and counter clockwise')
+        for (x, y), (ex, ey) in zip(vertices, edges):
+            if cross(x, y, ex, ey) <= 0:
+                raise ValueError('The origin must be strictly inside the arena')
+
+        # Start at the vertex with the smallest polar angle so that the angles
+        # are increasing along the list.
+        angles = [math.atan2(y, x) % TWO_PI for x, y in vertices]
+        start = angles.index(min(angles))
+        vertices = vertices[start:] + vertices[:start]
+        angles = angles[start:] + angles[:start]
+
+        # Make the positive X axis crossing the first vertex so that arc
+        # length 0 is at polar angle 0.
+        if angles[0] != 0:
+            x1, y1 = vertices[-1]
+            x2, y2 = vertices[0]
+            ex, ey = x2 - x1, y2 - y1
+            r = cross(x1, y1, ex, ey) / cross(1, 0, ex, ey)
+            vertices = [(r, 0.0)] + vertices
+            angles = [0.0] + angles
+
+        for a1, a2 in zip(angles, angles[1:]):
+            if a2 <= a1:
+                raise ValueError('Arena vertices must go around the origin only once')
+
+        # Close the polygon
+        self.xs = [x for x, y in vertices] + [vertices[0][0]]
+        self.ys = [y for x, y in vertices] + [vertices[0][1]]
+        self.angles = angles + [TWO_PI]
+
+        self.arcs = [0.0]
+        for i in range(len(vertices)):
+            self.arcs.append(self.arcs[-1] + math.hypot(self.xs[i + 1] - self.xs[i], self.ys[i + 1] - self.ys[i]))
+        self.length = self.arcs[-1]
+
+        # Smallest distance from the center to the rim
+        self.inradius = min(cross(self.xs[i], self.ys[i], self.xs[i + 1] - self.xs[i], self.ys[i + 1] - self.ys[i]) / (self.arcs[i + 1] - self.arcs[i]) for i in range(len(vertices)))
+
+    '''
+    Polygon vertices, for drawing.
+    '''
+    @property
+    def vertices(self):
+        return list(zip(self.xs[:-1], self.ys[:-1]))
+
+    '''
+    Index of the edge containing arc length s or polar angle theta.
+    '''
+    def segment(self, table, value):
+        return min(bisect_right(table, value) - 1, len(table) - 2)
+
+    '''
+    s: Arc length of a point on the rim.
+    Return: Cartesian coordinates of the point.
+    '''
+    def point(self, s):
+        s %= self.length
+        i = self.segment(self.arcs, s)
+        t = (s - self.arcs[i]) / (self.arcs[i + 1] - self.arcs[i])
+        x = self.xs[i] + t * (self.xs[i + 1] - self.xs[i])
+        y = self.ys[i] + t * (self.ys[i + 1] - self.ys[i])
+        return x, y
+
+    '''
+    Return: Index of the edge crossed by the ray of polar angle theta and the
+    distance from the center to the crossing point.
+    '''
+    def ray(self, theta):
+        theta %= TWO_PI
+        i = self.segment(self.angles, theta)
+        ex = self.xs[i + 1] - self.xs[i]
+        ey = self.ys[i + 1] - self.ys[i]
+        r = cross(self.xs[i], self.ys[i], ex, ey) / cross(math.cos(theta), math.sin(theta), ex, ey)
+        return i, r
+
+    '''
+    theta: Polar angle
+    Return: Distance from the center to the rim in the direction theta.
+    '''
+    def radius(self, theta):
+        return self.ray(theta)[1]
+
+    '''
+    x, y: Cartesian coordinates of a point other than the center.
+    Return: Arc length of the rim point on the ray from the center through
+    (x, y). This is not the closest rim point unless the arena is a circle.
+    '''
+    def project(self, x, y):
+        theta = math.atan2(y, x)
+        i, r = self.ray(theta)
+        return self.arcs[i] + math.hypot(r * math.cos(theta) - self.xs[i], r * math.sin(theta) - self.ys[i])
+
+    '''
+    Return: True if the point (x, y) is on or outside the rim.
+    '''
+    def escaped(self, x, y):
+        return math.hypot(x, y) >= self.radius(math.atan2(y, x))
+
+    '''
+    s1, s2: Arc lengths of two points on the rim.
+    Return: Length of the shorter of the two arcs joining the points.
+    '''
+    def arcDistance(self, s1, s2):
+        d = abs(s2 - s1) % self.length
+        return min(d, self.length - d)
+
+class Circle(Arena):
+    '''
+    Circle centered on the origin. The vertices are only used for drawing,
+    all the lookups are exact.
+    '''
+    def __init__(self, radius=1.0, n=360):
+        self.r = radius
+        Arena.__init__(self, [(radius * math.cos(TWO_PI * i / n), radius * math.sin(TWO_PI * i / n)) for i in range(n)])
+        self.length = TWO_PI * radius
+        self.inradius = radius
+
+    def point(self, s):
+        return self.r * math.cos(s / self.r), self.r * math.sin(s / self.r)
+
+    def radius(self, theta):
+        return self.r
+
+    def project(self, x, y):
+        return math.atan2(y, x) % TWO_PI * self.r
+
+    def escaped(self, x, y):
+        return x ** 2 + y ** 2 >= self.r ** 2
+
+class Ellipse(Arena):
+    '''
+    Ellipse centered on the origin with semi-axes a along X and b along Y,
+    approximated by a polygon of n vertices.
+    '''
+    def __init__(self, a, b, n=4096):
+        Arena.__init__(self, [(a * math.cos(TWO_PI * i / n), b * math.sin(TWO_PI * i / n)) for i in range(n)])
@@ -12,6 +12,11 @@ as scaling the cirle up or down will just speed or slow things up. Same goes
 for the cat speed. In fact, only the ratio of cat to mouse velocity has any
 effect on the solution or lack of solution for that matter.
 
+The circle can be replaced by any convex arena by setting ARENA, see arena.py.
+Angles beta on the circle then become arc lengths along the rim of the arena,
+measured from the point where the rim crosses the positive X axis. The cat
+position, which is always at 0 on the circle, is given by the cat argument.
+
 @author: tarik
 """
 
@@ -19,38 +24,45 @@ import math
 import numpy as np
 from scipy.optimize import minimize
 from scipy.optimize import brentq
+from arena import Circle
+from contour import marchingSquares
 
 CAT_TO_MOUSE_SPEED_RATIO = 4
 ANGLE_INTERVALS = 360
+DISTANCE_INTERVALS = 100
+RIM_INTERVALS = 720
+SEED_INTERVALS = 18
 DEBUG = False
+ARENA = Circle()
 
 '''
 alpha, distance: Polar coordinates of point M representing the mouse.
-beta, 1: Polar coordinates of an arbitrary point P on the circle.
+beta: Arc length of an arbitrary point P on the rim. On the unit circle, beta, 1
+are the polar coordinates of P.
 Return value: Distance between M and P
 '''
 def distanceToEdge(distance, alpha, beta):
     '''
-    (cos(alpha), 0) represent the cartesian coordinates of M. We assume here
-    that the mouse is located on the X axis.
-    P is located at coordinates (cos(alpha), sin(alpha))
+    (distance * cos(alpha), distance * sin(alpha)) represent the cartesian
+    coordinates of M.
     '''
-    return math.sqrt((distance - math.cos(alpha - beta)) ** 2 + math.sin(alpha - beta) ** 2)
+    x, y = ARENA.point(beta)
+    return math.sqrt((distance * math.cos(alpha) - x) ** 2 + (distance * math.sin(alpha) - y) ** 2)
 
 '''
-beta, 1: Coordinates of an arbitrary point P on the circle.
-0, 1: Position of the cat. This assumption has no effect as we can always
-use a rotation transform to position the cat at 0, 1.
+beta: Arc length of an arbitrary point P on the rim.
+cat: Arc length of the position of the cat. On the circle, this is always 0,
+1 as we can always use a rotation transform to position the cat at 0, 1.
 
 We define here the distance of C to P as the length of the arc with the minimum
-distance. Alternatively, the arc of lenth <= PI.
+distance. Alternatively, the arc of lenth <= half the rim length.
 '''
-def distanceViaEdge(beta):
-    return min(abs(beta), 2 * math.pi - abs(beta))
+def distanceViaEdge(beta, cat=0):
+    return ARENA.arcDistance(cat, beta)
 
 '''
 alpha, distance: Polar coordinates of point M representing the mouse.
-beta, 1: Polar coordinates of an arbitrary point P on the circle.
+beta: Arc length of an arbitrary point P on the rim.
 Return: Difference in time between the cat arrival at point P traveling on
 the edge of the circle and the arrival of the mouse at point P traveling through
 a straight line from point M.
@@ -65,32 +77,45 @@ can escape via a point P determined by alpha. A positive time difference
 indicates a success. Conversly, a zero or negative time difference determines
 a failure. 
 '''
-def diffTimeCatMouse(distance, alpha, beta):
-    return distanceViaEdge(beta) - distanceToEdge(distance, alpha, beta) * CAT_TO_MOUSE_SPEED_RATIO
+def diffTimeCatMouse(distance, alpha, beta, cat=0):
+    return distanceViaEdge(beta, cat) - distanceToEdge(distance, alpha, beta) * CAT_TO_MOUSE_SPEED_RATIO
+
+'''
+f: Function to minimize over [a, b] or [b, a].
+Return: The best of SEED_INTERVALS + 1 samples of f, starting with a.
+'''
+def seed(f, a, b):
+    betas = [a + i * (b - a) / SEED_INTERVALS for i in range(SEED_INTERVALS + 1)]
+    return min(betas, key=lambda beta : f([beta]))
 
 '''
 alpha, distance: Polar coordinates of point M representing the mouse
-0, 1: Position of the cat. This assumption has no effect as we can always
-use a rotation transform to position the cat at 0, 1.
+cat: Arc length of the position of the cat. On the circle, this is always 0,
+1 as we can always use a rotation transform to position the cat at 0, 1.
 
-Determine the angle of point with polar coordinates (beta, 1) that maximizes
-the difference in arrival time between the mouse and the cat. Note that the
-shortest path from the mouse to the edge of the circle in not optimum.
+Determine the arc length of point P on the rim that maximizes the difference
+in arrival time between the mouse and the cat. Note that the shortest path
+from the mouse to the edge of the circle in not optimum.
+The returned arc length is in the range [cat, cat + ARENA.length].
+Each half of the rim is searched from its best of SEED_INTERVALS samples, as
+the difference can have several local maxima away from the circle.
 '''
-def maxDiffTimeCatMouse(distance, alpha):
-    f1 = lambda beta : -(beta - CAT_TO_MOUSE_SPEED_RATIO * distanceToEdge(distance, alpha, beta))
-    x0 = np.array([0])
-    bounds = [(0, math.pi)]
+def maxDiffTimeCatMouse(distance, alpha, cat=0):
+    half = ARENA.length / 2
+
+    f1 = lambda beta : -((beta[0] - cat) - CAT_TO_MOUSE_SPEED_RATIO * distanceToEdge(distance, alpha, beta[0]))
+    x0 = np.array([seed(f1, cat, cat + half)])
+    bounds = [(cat, cat + half)]
     res = minimize(f1, x0, method='L-BFGS-B', bounds=bounds)
     argmax1 = res['x'][0]
-    max1 = -res['fun'][0]    
+    max1 = -np.asarray(res['fun']).item()
     
-    f2 = lambda beta : -((2 * math.pi - beta) - CAT_TO_MOUSE_SPEED_RATIO * distanceToEdge(distance, alpha, beta))
-    x0 = np.array([2 * math.pi])
-    bounds = [(math.pi, 2 * math.pi)]
+    f2 = lambda beta : -((cat + ARENA.length - beta[0]) - CAT_TO_MOUSE_SPEED_RATIO * distanceToEdge(distance, alpha, beta[0]))
+    x0 = np.array([seed(f2, cat + ARENA.length, cat + half)])
+    bounds = [(cat + half, cat + ARENA.length)]
     res = minimize(f2, x0, method='L-BFGS-B', bounds=bounds)
     argmax2 = res['x'][0]
-    max2 = -res['fun'][0]    
+    max2 = -np.asarray(res['fun']).item()
        
     if max1 >= max2:
         return argmax1, max1
@@ -99,13 +124,21 @@ def maxDiffTimeCatMouse(distance, alpha):
 
 '''
 alpha, distance: Polar coordinates of point M representing the mouse.
-0, 1: Polar coordinates of cat
+cat: Arc length of the position of the cat. 0, 1 are its polar coordinates on
+the circle.
 Given alpha, determine the minimum distance of the mouse from the center
-to allow for an escape.
+to allow for an escape. The distance is at most the distance to the rim.
 '''
-def minimumEscapeDistance(alpha):
-    f = lambda distance : maxDiffTimeCatMouse(distance, alpha)[1]
-    distance = brentq(f, 0, 1)
+def minimumEscapeDistance(alpha, cat=0):
+    f = lambda distance : maxDiffTimeCatMouse(distance, alpha, cat)[1]
+    rim = ARENA.radius(alpha)
+    # Facing the cat, the mouse only escapes from the rim itself
+    if f(rim) <= 0:
+        return rim
+    # In elongated arenas, the mouse can escape from the center
+    if f(0) > 0:
+        return 0
+    distance = brentq(f, 0, rim)
     return distance
 
 '''
@@ -113,11 +146,82 @@ Calculate a list of points defining a boundary between two regions. All the
 points on top region represent success initial positions from which the mouse
 has a guaranteed escape. The bottom region are failure start positions.
 '''
-def getBoundary():
+def getBoundary(cat=0):
     interval_size = math.pi * 2 / ANGLE_INTERVALS
     alphas = [i * interval_size for i in range(ANGLE_INTERVALS + 1)]
-    distances = [minimumEscapeDistance(alpha) for alpha in alphas]
+    distances = [minimumEscapeDistance(alpha, cat) for alpha in alphas]
     if DEBUG:
         for i, alpha in enumerate(alphas):
             print (i, alpha, distances[i])
     return alphas, distances
+
+'''
+distances, alphas: Arrays of polar coordinates of points M representing the
+mouse.
+cat: Arc length of the position of the cat.
+Vectorized version of maxDiffTimeCatMouse returning the maximum difference in
+arrival time for every point M. Instead of optimizing beta, the rim is sampled
+every ARENA.length / RIM_INTERVALS and the best sample is kept. The samples
+include the point diametrically opposite the cat when RIM_INTERVALS is even.
+Since every sample is compared, this finds the global maximum, where the local
+optimization in maxDiffTimeCatMouse can stop on a local one far from the
+escape boundary.
+'''
+def maxDiffTimeGrid(distances, alphas, cat=0):
+    distances, alphas = np.broadcast_arrays(np.asarray(distances, dtype=float), np.asarray(alphas, dtype=float))
+    x = distances * np.cos(alphas)
+    y = distances * np.sin(alphas)
+    interval_size = ARENA.length / RIM_INTERVALS
+    diff = np.full(x.shape, -np.inf)
+    for i in range(RIM_INTERVALS):
+        beta_x, beta_y = ARENA.point(cat + i * interval_size)
+        via_edge = min(i, RIM_INTERVALS - i) * interval_size
+        diff = np.maximum(diff, via_edge - CAT_TO_MOUSE_SPEED_RATIO * np.hypot(x - beta_x, y - beta_y))
+    return diff
+
+'''
+Calculate the boundary between the escape region and the failure region from
+a single evaluation of maxDiffTimeGrid on a grid of ANGLE_INTERVALS angles by
+DISTANCE_INTERVALS distances, scaled to the rim in every direction. The zero
+level of the grid is followed with marching squares. Unlike getBoundary, the
+escape region does not need to have a single boundary distance per angle.
+
+polish: If True, every crossing of the boundary with a grid edge is refined by
+finding the zero of maxDiffTimeCatMouse along the edge instead of
+interpolating the grid values. The interpolation is kept for edges where
+maxDiffTimeCatMouse does not change sign.
+Return: List of (alphas, distances) polylines. Polylines are split where
+alpha wraps around at 2 * PI.
+'''
+def getEscapeRegion(polish=False, cat=0):
+    alphas = np.linspace(0, 2 * math.pi, ANGLE_INTERVALS + 1)
+    rims = np.array([ARENA.radius(alpha) for alpha in alphas])
+    scales = np.linspace(0, 1, DISTANCE_INTERVALS + 1)
+    distances = scales[:, np.newaxis] * rims
+    Z = maxDiffTimeGrid(distances, alphas, cat)
+
+    # Grid indices to polar coordinates
+    def polar(i, j):
+        alpha = j * 2 * math.pi / ANGLE_INTERVALS
+        return i / DISTANCE_INTERVALS * ARENA.radius(alpha), alpha
+
+    # Exact values at grid points are shared by up to four edges
+    exact = {}
+    def corner(a):
+        if a not in exact:
+            exact[a] = maxDiffTimeCatMouse(*polar(*a), cat)[1]
+        return exact[a]
+
+    def crossing(a, b):
+        t = Z[a] / (Z[a] - Z[b])
+        if corner(a) * corner(b) < 0:
+            f = lambda t : maxDiffTimeCatMouse(*polar(a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1])), cat)[1]
+            t = brentq(f, 0, 1, xtol=1e-6)
+        return t
+
+    polylines = marchingSquares(Z, crossing if polish else None)
+    boundary = []
+    for polyline in polylines:
+        distances, alphas = zip(*[polar(i, j) for i, j in polyline])
+        boundary.append((list(alphas), list(distances)))
+    return boundary
@@ -12,6 +12,7 @@ from pygame import time
 import math
 from pygame import gfxdraw
 import catmouse
+import arena
 
 FRAME_RATE = 1000
 
@@ -74,7 +75,7 @@ def main():
         cat_position = get_updated_cat_position(clock, cat_direction, cat_position)
         mouse_position = get_updated_mouse_position(clock, mouse_position, mouse_direction)
         
-        draw_circle(screen)
+        draw_arena(screen)
         draw_cat(screen, cat_position)
         draw_mouse(screen, mouse_position)
         
@@ -91,11 +92,11 @@ def main():
         
 def get_updated_cat_position(clock, cat_direction, cat_position):
     cat_position += cat_direction * CAT_VELOCITY * clock.get_time() / 1000.0
-    two_pi = 2 * math.pi
-    if cat_position > two_pi:
-        cat_position -= two_pi
+    length = catmouse.ARENA.length
+    if cat_position > length:
+        cat_position -= length
     elif cat_position < 0:
-        cat_position += two_pi
+        cat_position += length
         
     return cat_position
 
@@ -108,14 +109,13 @@ def get_updated_mouse_position(clock, mouse_position, mouse_direction):
     y += v_y * MOUSE_VELOCITY * clock.get_time() / 1000.0
     return (x, y)
             
-def draw_circle(screen):
+def draw_arena(screen):
     screen.fill((0, 0, 0))
-    pygame.gfxdraw.aacircle(screen, CENTER_X, CENTER_Y, RADIUS, CIRCLE_COLOR)
+    points = [mouse_position_to_screen_coordinates(vertex) for vertex in catmouse.ARENA.vertices]
+    pygame.gfxdraw.aapolygon(screen, points, CIRCLE_COLOR)
         
 def cat_position_to_screen_coordinates(cat_position):
-    cat_x = int(CENTER_X + RADIUS * math.cos(cat_position))
-    cat_y = int(CENTER_Y + RADIUS * math.sin(cat_position))
-    return (cat_x, cat_y)
+    return mouse_position_to_screen_coordinates(catmouse.ARENA.point(cat_position))
 
 def mouse_position_to_screen_coordinates(mouse_position):
     x = mouse_position[0]
@@ -164,17 +164,18 @@ def get_cat_move(cat_position, mouse_position, velocity_ratio):
     if (mouse_x == 0 and mouse_y == 0):
         return 0
     
-    mouse_angle = math.atan2(mouse_y, mouse_x)
-    if mouse_angle < 0:
-        mouse_angle += 2 * math.pi
+    # Rim point on the ray from the center through the mouse. This is the
+    # rim point closest to the mouse on the circle only.
+    mouse_rim_position = catmouse.ARENA.project(mouse_x, mouse_y)
+    length = catmouse.ARENA.length
             
-    if abs(mouse_angle - cat_position) < DISTANCE_TOLERANCE:
+    if abs(mouse_rim_position - cat_position) < DISTANCE_TOLERANCE:
         cat_move = 0
     else:
-        diff = mouse_angle - cat_position
+        diff = mouse_rim_position - cat_position
         if diff < 0:
-            diff += 2 * math.pi
-        if 0 < diff < math.pi:
+            diff += length
+        if 0 < diff < length / 2:
             cat_move = 1
         else:
             cat_move = -1
@@ -182,8 +183,7 @@ def get_cat_move(cat_position, mouse_position, velocity_ratio):
     return cat_move
 
 def mouse_caught(cat_position, mouse_position, distance_tolerance):
-    cat_x = math.cos(cat_position)
-    cat_y = math.sin(cat_position)
+    cat_x, cat_y = catmouse.ARENA.point(cat_position)
     mouse_x = mouse_position[0]
     mouse_y = mouse_position[1]
     
@@ -194,7 +194,7 @@ def mouse_escaped(mouse_position):
     mouse_x = mouse_position[0]
     mouse_y = mouse_position[1]
     
-    return mouse_x ** 2 + mouse_y ** 2 >= 1    
+    return catmouse.ARENA.escaped(mouse_x, mouse_y)
 
 class mouse_auto:
     def __init__(self):
@@ -210,27 +210,33 @@ class mouse_auto:
 
         '''
         Phase 0: Progress from the center to a radius of
-        1 / velocity_ratio while staying on a diametrically
+        inner_radius while staying on a diametrically
         oposite angle from the cat. This is possible within
-        the circle of radius of 1 / velocity_ratio because the
+        the circle of radius of inner_radius because the
         angular velocity of the mouse can be keep up with the
-        angular velocity of the cat.
+        angular velocity of the cat. A cat on the rim at a distance
+        R from the center turns around the center at an angular
+        velocity of at most 1 / R times its velocity, so at most
+        1 / ARENA.inradius. On the unit circle, inner_radius is
+        1 / velocity_ratio.
         ''' 
+        inner_radius = catmouse.ARENA.inradius / velocity_ratio
         if self.phase == 0:
             # Angle diametrically opposite to the cat
-            target_angle = cat_position + math.pi
+            cat_x, cat_y = catmouse.ARENA.point(cat_position)
+            target_angle = math.atan2(cat_y, cat_x) + math.pi
             if target_angle > 2 * math.pi:
                 target_angle -= 2 * math.pi
 
             # If the mouse is equal to the target angle within a small tolerance
             if abs(target_angle - mouse_angle) < DISTANCE_TOLERANCE:
-                # Continue progressing outward until 1 / velocity_ratio is reached
-                if mouse_r < 1 / velocity_ratio - DISTANCE_TOLERANCE:
+                # Continue progressing outward until inner_radius is reached
+                if mouse_r < inner_radius - DISTANCE_TOLERANCE:
                     v_x = math.cos(mouse_angle)
                     v_y = math.sin(mouse_angle)
                     return (v_x, v_y)
-                # 1 / velocity_ratio has been passed, backtrack a bit
-                elif mouse_r > 1 / velocity_ratio:
+                # inner_radius has been passed, backtrack a bit
+                elif mouse_r > inner_radius:
                     v_x = -math.cos(mouse_angle)
                     v_y = -math.sin(mouse_angle)
                     return (v_x, v_y)
@@ -251,22 +257,22 @@ class mouse_auto:
                 else:
                     angle_direction = -1
 
-                # If the mouse has not reached the distance of 1 / velocity_ratio,
+                # If the mouse has not reached the distance of inner_radius,
                 # continue progressing but also move in a tangent to keep up with
                 # the cat and stay diametrically opposite.
-                if mouse_r < 1 / velocity_ratio - DISTANCE_TOLERANCE:
-                    v_r = math.sqrt(1/velocity_ratio ** 2 - mouse_r ** 2)
+                if mouse_r < inner_radius - DISTANCE_TOLERANCE:
+                    v_r = math.sqrt(inner_radius ** 2 - mouse_r ** 2) / (inner_radius * velocity_ratio)
                     v_t = math.sqrt(1 - v_r ** 2)
                     v_x = math.cos(mouse_angle) * v_r + angle_direction * math.cos(mouse_angle + math.pi / 2) * v_t
                     v_y = math.sin(mouse_angle) * v_r + angle_direction * math.sin(mouse_angle + math.pi / 2) * v_t
                     return (v_x, v_y)
-                # If the mouse has passed 1 / velocity_ratio, backtrack. Otherwise
+                # If the mouse has passed inner_radius, backtrack. Otherwise
                 # the mouse will not be able to keep up with the cat in terms of rotation.
-                elif mouse_r > 1 / velocity_ratio:
+                elif mouse_r > inner_radius:
                     v_x = -math.cos(mouse_angle)
                     v_y = -math.sin(mouse_angle)
                     return (v_x, v_y)
-                # The mouse is close to the edge of the circle with radius 1 / velocity_ratio
+                # The mouse is close to the edge of the circle with radius inner_radius
                 # Keep rotating to ensure the mouse is diametrically opposite the cat within an
                 # acceptable tolerance.
                 else:
@@ -278,17 +284,15 @@ class mouse_auto:
         # in such a way that no matter what the cat does (what direction it takes)
         # it will not be able to get to the mouse on time.
         else:
-            mouse_angle = mouse_angle - cat_position
-            if mouse_angle < 0:
-                mouse_angle += 2 * math.pi
+            escape_position = catmouse.maxDiffTimeCatMouse(mouse_r, mouse_angle, cat_position)[0]
+            escape_x, escape_y = catmouse.ARENA.point(escape_position)
 
-            escape_angle = catmouse.maxDiffTimeCatMouse(mouse_r, mouse_angle)[0]
-            escape_angle = escape_angle + cat_position
-            if escape_angle > 2 * math.pi:
-                escape_angle -= 2 * math.pi
-
-            v_x = math.cos(escape_angle)
-            v_y = math.sin(escape_angle)
+            # Head in a straight line towards the escape point
+            distance = math.sqrt((escape_x - mouse_x) ** 2 + (escape_y - mouse_y) ** 2)
+            if distance < DISTANCE_TOLERANCE:
+                return (math.cos(mouse_angle), math.sin(mouse_angle))
+            v_x = (escape_x - mouse_x) / distance
+            v_y = (escape_y - mouse_y) / distance
             return (v_x, v_y)
 
 # run the main function only if this module is executed as the main script
@@ -301,6 +305,12 @@ if __name__=="__main__":
     else:
         get_mouse_move = get_mouse_move_human
 
+    str_arena = input('Input \'e\' for an elliptic arena, \'h\' for an hexagonal arena, press enter otherwise to keep the circle: ')
+    if str_arena == 'e':
+        catmouse.ARENA = arena.Ellipse(1.0, 0.6)
+    elif str_arena == 'h':
+        catmouse.ARENA = arena.Arena([(math.cos(i * math.pi / 3), math.sin(i * math.pi / 3)) for i in range(6)])
+
     str_velocity_ratio = input('Input cat to mouse velocity ratio (0.1 to 10) or press enter to keep the default of 4: ')
     try:
         VELOCITY_RATIO = float(str_velocity_ratio)
@@ -4,7 +4,17 @@ from catmouse import diffTimeCatMouse
 from catmouse import distanceToEdge
 from catmouse import distanceViaEdge
 from catmouse import maxDiffTimeCatMouse
+import catmouse
+from catmouse import minimumEscapeDistance
+from catmouse import maxDiffTimeGrid
+from catmouse import getEscapeRegion
+from catmouse import getBoundary
+from contour import marchingSquares
+from arena import Arena
+from arena import Circle
+from arena import Ellipse
 import math
+import numpy as np
 
 class Test_CatMouse(unittest.TestCase):
     def testDiffCatMouse(self):
@@ -30,6 +40,130 @@ class Test_CatMouse(unittest.TestCase):
         self.assertGreater(maxDiffTimeCatMouse(0.5, math.pi / 2)[0], math.pi / 2)
         self.assertLess(maxDiffTimeCatMouse(0.5, math.pi * 1.5)[0], math.pi * 1.5)
 
+class Test_EscapeRegion(unittest.TestCase):
+    def setUp(self):
+        self.intervals = catmouse.ANGLE_INTERVALS, catmouse.DISTANCE_INTERVALS
+        self.arena, self.ratio = catmouse.ARENA, catmouse.CAT_TO_MOUSE_SPEED_RATIO
+        catmouse.ANGLE_INTERVALS, catmouse.DISTANCE_INTERVALS = 36, 20
+
+    def tearDown(self):
+        catmouse.ANGLE_INTERVALS, catmouse.DISTANCE_INTERVALS = self.intervals
+        catmouse.ARENA, catmouse.CAT_TO_MOUSE_SPEED_RATIO = self.arena, self.ratio
+
+    def testMaxDiffTimeGrid(self):
+        for alpha in (i * math.pi / 6 for i in range(12)):
+            for distance in (0.25, 0.5, 0.75):
+                diffTime = maxDiffTimeGrid([distance], [alpha])[0]
+                maxDiffTime = max(diffTimeCatMouse(distance, alpha, i * math.pi / 3600) for i in range(7200))
+                self.assertAlmostEqual(diffTime, maxDiffTime, 3)
+
+    def testGetEscapeRegion(self):
+        boundary = getEscapeRegion(polish=True)
+        self.assertEqual(len(boundary), 1)
+        for alpha, distance in zip(*boundary[0]):
+            if distance < 0.99:
+                self.assertAlmostEqual(maxDiffTimeCatMouse(distance, alpha)[1], 0, 6)
+        distances = [distance for alpha, distance in zip(*boundary[0]) if math.isclose(alpha, math.pi)]
+        self.assertEqual(len(distances), 1)
+        self.assertAlmostEqual(distances[0], minimumEscapeDistance(math.pi), 6)
+
+    def testNotStarShaped(self):
+        # The mouse escapes from the center and near the rim, but not in
+        # between, so some angles cross the boundary twice.
+        catmouse.ARENA = Ellipse(3, 1)
+        catmouse.CAT_TO_MOUSE_SPEED_RATIO = 3.5
+        alpha = math.pi / 18
+        boundary = getEscapeRegion(polish=True)
+        for alphas, distances in boundary:
+            for a, distance in zip(alphas, distances):
+                if distance < 0.99 * catmouse.ARENA.radius(a):
+                    self.assertAlmostEqual(maxDiffTimeCatMouse(distance, a)[1], 0, 6)
+        distances = sorted(distance for alphas, distances in boundary for a, distance in zip(alphas, distances) if math.isclose(a, alpha))
+        self.assertEqual(len(distances), 2)
+        near, far = distances
+        self.assertGreater(maxDiffTimeGrid(near / 2, alpha), 0)
+        self.assertLess(maxDiffTimeGrid((near + far) / 2, alpha), 0)
+        self.assertGreater(maxDiffTimeGrid((far + catmouse.ARENA.radius(alpha)) / 2, alpha), 0)
+
+    def testMarchingSquares(self):
+        # Unit disc sampled on a grid centered on (10, 10)
+        i, j = np.mgrid[0:21, 0:21]
+        Z = 10 - np.hypot(i - 10, j - 10)
+        polylines = marchingSquares(Z)
+        self.assertEqual(len(polylines), 1)
+        np.testing.assert_array_equal(polylines[0][0], polylines[0][-1])
+        for i, j in polylines[0]:
+            self.assertAlmostEqual(math.hypot(i - 10, j - 10), 10, 1)
+
+class Test_EllipseBoundary(unittest.TestCase):
+    def setUp(self):
+        self.arena, self.intervals = catmouse.ARENA, catmouse.ANGLE_INTERVALS
+        catmouse.ANGLE_INTERVALS = 36
+
+    def tearDown(self):
+        catmouse.ARENA, catmouse.ANGLE_INTERVALS = self.arena, self.intervals
+
+    def testGetBoundary(self):
+        catmouse.ARENA = Ellipse(1.5, 1)
+        alphas, distances = getBoundary()
+        self.assertEqual(distances[0], 1.5)
+        for alpha, distance in zip(alphas[1:-1], distances[1:-1]):
+            self.assertGreater(distance, 0)
+            self.assertLess(distance, catmouse.ARENA.radius(alpha))
+            self.assertAlmostEqual(maxDiffTimeCatMouse(distance, alpha)[1], 0, 6)
+
+    def testEscapeFromCenter(self):
+        catmouse.ARENA = Ellipse(4, 1)
+        self.assertEqual(minimumEscapeDistance(math.pi / 2), 0)
+        self.assertEqual(minimumEscapeDistance(0), 4)
+
+class Test_Arena(unittest.TestCase):
+    def testCircle(self):
+        circle = Circle()
+        ellipse = Ellipse(1, 1)
+        self.assertAlmostEqual(circle.length, 2 * math.pi)
+        self.assertAlmostEqual(ellipse.length, 2 * math.pi, 5)
+        for s in (i * math.pi / 18 for i in range(36)):
+            x1, y1 = circle.point(s)
+            x2, y2 = ellipse.point(s)
+            self.assertAlmostEqual(x1, x2, 5)
+            self.assertAlmostEqual(y1, y2, 5)
+            self.assertAlmostEqual(ellipse.radius(s), 1, 5)
+            self.assertAlmostEqual(ellipse.project(0.5 * x1, 0.5 * y1), s, 5)
+
+    def testSquare(self):
+        square = Arena([(-1, 1), (-1, -1), (1, -1), (1, 1)])
+        self.assertEqual(square.length, 8)
+        self.assertEqual(square.point(0), (1, 0))
+        self.assertEqual(square.point(1), (1, 1))
+        self.assertEqual(square.point(9), (1, 1))
+        self.assertAlmostEqual(square.radius(math.pi / 4), math.sqrt(2))
+        self.assertAlmostEqual(square.project(0.5, 0.5), 1)
+        self.assertAlmostEqual(square.project(0.5, -0.5), 7)
+        self.assertTrue(square.escaped(1, 0.5))
+        self.assertFalse(square.escaped(0.99, 0.5))
+        self.assertEqual(square.arcDistance(1, 7), 2)
+        self.assertEqual(square.inradius, 1)
+        self.assertAlmostEqual(Ellipse(1, 0.6).inradius, 0.6, 5)
+
+    def testNotConvex(self):
+        with self.assertRaises(ValueError):
+            Arena([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        with self.assertRaises(ValueError):
+            Arena([(1, 0), (0.1, 0.1), (0, 1), (-1, 0), (0, -1)])
+
+    def testOriginOutside(self):
+        with self.assertRaises(ValueError):
+            Arena([(1, -1), (2, 1), (1, 1)])
+        with self.assertRaises(ValueError):
+            Arena([(1, 1), (2, 1), (2, 2), (1, 2)])
+        with self.assertRaises(ValueError):
+            Arena([(1, 1), (1, -1), (-1, -1), (-1, 1)])
+
+    def testWindingTwice(self):
+        with self.assertRaises(ValueError):
+            Arena([(math.cos(i * 4 * math.pi / 5), math.sin(i * 4 * math.pi / 5)) for i in range(5)])
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:37:05 2026
+
+Zero level set extraction from a grid of values with marching squares.
+
+Each grid cell with corners of both signs is crossed by one segment, or two
+for a saddle cell, joining crossing points on its edges. A crossing point is
+shared by the two cells on either side of its edge, which is how the segments
+are chained into polylines. Polylines reaching the border of the grid are
+open, the others are closed and end with their first point.
+"""
+
+import numpy as np
+
+'''
+z1, z2: Values at both ends of an edge, of different signs.
+Return: Position of the zero along the edge, from 0 at z1 to 1 at z2, using
+a linear interpolation.
+'''
+def linearCrossing(z1, z2):
+    return z1 / (z1 - z2)
+
+'''
+Z: 2D array of values.
+crossing: Function of the two grid indices (i1, j1), (i2, j2) at both ends of
+an edge returning the position of the zero along the edge, from 0 to 1. The
+default is a linear interpolation of Z.
+Return: List of polylines following Z = 0. Each polyline is an array of
+(i, j) fractional grid indices.
+'''
+def marchingSquares(Z, crossing=None):
+    Z = np.asarray(Z, dtype=float)
+    if crossing is None:
+        crossing = lambda a, b : linearCrossing(Z[a], Z[b])
+    above = Z > 0
+
+    # Cells with corners on both sides of the level set
+    corners = above[:-1, :-1].astype(int) + above[:-1, 1:] + above[1:, 1:] + above[1:, :-1]
+    cells = zip(*np.nonzero((corners > 0) & (corners < 4)))
+
+    '''
+    Crossing point on the edge starting at grid point (i, j), along j for a
+    'h' edge and along i for a 'v' edge.
+    '''
+    points = {}
+    def point(edge):
+        if edge not in points:
+            direction, i, j = edge
+            if direction == 'h':
+                points[edge] = (i, j + crossing((i, j), (i, j + 1)))
+            else:
+                points[edge] = (i + crossing((i, j), (i + 1, j)), j)
+        return points[edge]
+
+    neighbours = {}
+    def link(edge1, edge2):
+        neighbours.setdefault(edge1, []).append(edge2)
+        neighbours.setdefault(edge2, []).append(edge1)
+
+    for i, j in cells:
+        # Cell corners and edges listed around the cell
+        a, b, c, d = (i, j), (i, j + 1), (i + 1, j + 1), (i + 1, j)
+        edges = [('h', i, j), ('v', i, j + 1), ('h', i + 1, j), ('v', i, j)]
+        signs = [above[a], above[b], above[c], above[d]]
+        crossed = [edge for k, edge in enumerate(edges) if signs[k] != signs[(k + 1) % 4]]
+        if len(crossed) == 2:
+            link(crossed[0], crossed[1])
+        # Saddle cell, use the center value to decide which corners are
+        # connected through the cell.
+        elif (Z[a] + Z[b] + Z[c] + Z[d] > 0) == signs[0]:
+            link(edges[0], edges[1])
+            link(edges[2], edges[3])
+        else:
+            link(edges[3], edges[0])
+            link(edges[1], edges[2])
+
+    # Open polylines start on the grid border, at an edge with a single
+    # neighbour. The remaining edges are on closed polylines.
+    polylines = []
+    starts = [edge for edge, linked in neighbours.items() if len(linked) == 1]
+    starts += list(neighbours)
+    visited = set()
+    for start in starts:
+        if start in visited:
+            continue
+        polyline = [start]
+        visited.add(start)
+        edge = start
+        while True:
+            following = [e for e in neighbours[edge] if e not in visited]
+            if not following:
+                break
+            edge = following[0]
+            polyline.append(edge)
+            visited.add(edge)
+        if len(polyline) > 2 and start in neighbours[edge]:
+            polyline.append(start)
+        polylines.append(np.array([point(edge) for edge in polyline]))
+    return polylines
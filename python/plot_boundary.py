@@ -36,8 +36,9 @@ ax.plot(alphas, distances)
 for i, (alpha, distance) in enumerate(zip(alphas, distances)):
     if i % 10 == 0:
         beta = catmouse.maxDiffTimeCatMouse(distance, alpha)[0]
-        angles = [alpha, beta]
-        rs = [distance, 1]
+        x, y = catmouse.ARENA.point(beta)
+        angles = [alpha, math.atan2(y, x)]
+        rs = [distance, math.hypot(x, y)]
         ax.plot(angles, rs, 'g')
 
 # Plot circle withon which the mouse can have a greater angular velocity than the cat.
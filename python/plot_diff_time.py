@@ -11,7 +11,8 @@ Positive values represent initial conditions that allow a mouse escape with a
 difference of time represented by the z axis.
 
 Zero or negative values indicate a failure to escape via a straight line
-starting from these initial conditions.
+starting from these initial conditions. The black line at zero height is the
+boundary between the two.
 
 
 @author: tarik
@@ -19,6 +20,7 @@ starting from these initial conditions.
 
 import math
 import catmouse
+import contour
 import numpy as np
 
 # This import registers the 3D projection, but is otherwise unused.
@@ -33,12 +35,8 @@ X = np.arange(0, 1, 0.025)
 Y = np.arange(0, 2 * math.pi, 0.025)
 X, Y = np.meshgrid(X, Y)
 
-# Function to strip off alpha and get optimal distance only
-def f(distance, beta):
-    return catmouse.maxDiffTimeCatMouse(distance, beta)[1]
-
 # Calculate distance difference. Positive means safe zone
-Z = np.vectorize(f)(X, Y)
+Z = catmouse.maxDiffTimeGrid(X, Y)
 
 # Create a 3D surface plot
 fig = plt.figure()
@@ -47,6 +45,12 @@ ax = fig.gca(projection='3d')
 # Plot the surface.
 surf = ax.plot_surface(X, Y, Z, cmap=cm.coolwarm, linewidth=0, antialiased=False)
 
+# Plot the escape region boundary, where the surface crosses zero
+for polyline in contour.marchingSquares(Z):
+    distances = np.interp(polyline[:, 1], np.arange(X.shape[1]), X[0])
+    alphas = np.interp(polyline[:, 0], np.arange(Y.shape[0]), Y[:, 0])
+    ax.plot(distances, alphas, np.zeros(len(polyline)), 'k')
+
 # Customize the z axis.
 ax.set_zlim(-7, 7)
 ax.zaxis.set_major_locator(LinearLocator(10))